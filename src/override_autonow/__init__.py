@@ -1,8 +1,24 @@
-from .context_decorator import override_autonow
+from .bulk import BulkWriter, CopyWriter, ExecuteManyWriter, bulk_load
+from .clock import MonotonicClock
+from .context_decorator import autonow_clock, override_autonow
+from .noop_saves import skip_noop_saves
+from .query import AutoNowManager, AutoNowQuerySet, AutoNowQuerySetMixin
+from .retimestamp import retimestamp
 
 __version__ = '0.0.1'
 
 __all__ = (
     '__version__',
+    'AutoNowManager',
+    'AutoNowQuerySet',
+    'AutoNowQuerySetMixin',
+    'BulkWriter',
+    'CopyWriter',
+    'ExecuteManyWriter',
+    'MonotonicClock',
+    'autonow_clock',
+    'bulk_load',
     'override_autonow',
+    'retimestamp',
+    'skip_noop_saves',
 )
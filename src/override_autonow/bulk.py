@@ -0,0 +1,252 @@
+import abc
+import datetime
+import io
+import itertools
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+from django.db import connections, router, transaction
+from django.db.models import Field, Model
+
+from .context_decorator import _ContextDecorator, get_active_clock, is_overridden
+from .fields import get_auto_fields, get_now
+
+Row = Union[Sequence[Any], Mapping[str, Any]]
+
+
+class BulkWriter(abc.ABC):
+    @abc.abstractmethod
+    def supports(self, connection) -> bool:
+        pass
+
+    @abc.abstractmethod
+    def write(self, connection, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+        pass
+
+
+class ExecuteManyWriter(BulkWriter):
+    def __init__(self, batch_size: int = 1000):
+        self.batch_size = batch_size
+
+    def supports(self, connection) -> bool:
+        return True
+
+    def write(self, connection, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+        quote_name = connection.ops.quote_name
+        sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+            quote_name(table),
+            ', '.join(quote_name(column) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        count = 0
+        with connection.cursor() as cursor:
+            for batch in _batched(rows, self.batch_size):
+                cursor.executemany(sql, batch)
+                count += len(batch)
+        return count
+
+
+class CopyWriter(BulkWriter):
+    def __init__(self, batch_size: int = 10000):
+        self.batch_size = batch_size
+
+    def supports(self, connection) -> bool:
+        if connection.vendor != 'postgresql':
+            return False
+        database = getattr(connection, 'Database', None)
+        return getattr(database, '__name__', None) in ('psycopg', 'psycopg2')
+
+    def write(self, connection, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+        quote_name = connection.ops.quote_name
+        sql = 'COPY %s (%s) FROM STDIN' % (
+            quote_name(table),
+            ', '.join(quote_name(column) for column in columns),
+        )
+        count = 0
+        with connection.cursor() as cursor:
+            if hasattr(cursor, 'copy_expert'):
+                # psycopg2
+                for batch in _batched(rows, self.batch_size):
+                    cursor.copy_expert(sql, io.StringIO(''.join(_format_copy_row(row) for row in batch)))
+                    count += len(batch)
+            else:
+                # psycopg 3 adapts the values itself
+                with cursor.copy(sql) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                        count += 1
+        return count
+
+
+def get_default_writers() -> Tuple[BulkWriter, ...]:
+    return CopyWriter(), ExecuteManyWriter()
+
+
+def bulk_load(
+        model: Type[Model],
+        rows: Iterable[Row],
+        fields: Sequence[str] = None,
+        *,
+        using: str = None,
+        override: _ContextDecorator = None,
+        writers: Sequence[BulkWriter] = None,
+) -> int:
+    model = model._meta.concrete_model
+    opts = model._meta
+    if opts.parents:
+        raise ValueError("Can't bulk load a multi-table inherited model")
+
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return 0
+    rows = itertools.chain((first_row,), rows)
+
+    if fields is None:
+        if isinstance(first_row, Mapping):
+            fields = list(first_row)
+        else:
+            fields = [field_instance.name for field_instance in opts.concrete_fields if field_instance is not opts.auto_field]
+    fields = list(fields)
+
+    concrete_fields: Dict[str, Field] = {}
+    for field_instance in opts.concrete_fields:
+        concrete_fields[field_instance.name] = field_instance
+        concrete_fields[field_instance.attname] = field_instance
+    try:
+        field_instances = [concrete_fields[name] for name in fields]
+    except KeyError as e:
+        raise ValueError('%s has no concrete field named %s' % (opts.object_name, e)) from None
+
+    # Auto fields that are not overridden are stamped like pre_save would, whether supplied or not.
+    stamped_fields = [
+        field_instance for field_instance in get_auto_fields(model)
+        if not _should_override(override, field_instance, model)
+    ]
+    clock = get_active_clock() if override is None else override.clock
+    supplied = [
+        (index, field_instance) for index, field_instance in enumerate(field_instances)
+        if field_instance not in stamped_fields
+    ]
+    # Omitted fields with a default get it like bulk_create would, the rest are left to the database.
+    defaulted_fields = [
+        field_instance for field_instance in opts.concrete_fields
+        if field_instance.has_default() and field_instance is not opts.auto_field
+        if field_instance not in field_instances and field_instance not in stamped_fields
+    ]
+    columns = [field_instance.column for _, field_instance in supplied]
+    columns += [field_instance.column for field_instance in defaulted_fields]
+    columns += [field_instance.column for field_instance in stamped_fields]
+    if not columns:
+        raise ValueError('No columns to load into %s' % opts.object_name)
+
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    writer = _get_writer(connection, writers)
+
+    def get_stamped() -> List[Any]:
+        return [
+            field_instance.get_db_prep_save(get_now(field_instance, clock), connection)
+            for field_instance in stamped_fields
+        ]
+
+    def prepare_rows() -> Iterator[List[Any]]:
+        # Without a clock every row gets the same timestamp, with one each row asks it for its own.
+        stamped = get_stamped() if clock is None else None
+        for row in rows:
+            if isinstance(row, Mapping):
+                try:
+                    values = [row[fields[index]] for index, _ in supplied]
+                except KeyError as e:
+                    raise ValueError('Row is missing a value for %s' % e) from None
+            else:
+                if len(row) != len(fields):
+                    raise ValueError('Expected %d values per row, got %d' % (len(fields), len(row)))
+                values = [row[index] for index, _ in supplied]
+            prepared = [
+                field_instance.get_db_prep_save(value, connection)
+                for value, (_, field_instance) in zip(values, supplied)
+            ]
+            prepared += [
+                field_instance.get_db_prep_save(field_instance.get_default(), connection)
+                for field_instance in defaulted_fields
+            ]
+            yield prepared + (get_stamped() if stamped is None else stamped)
+
+    with transaction.atomic(using=using, savepoint=False):
+        return writer.write(connection, opts.db_table, columns, prepare_rows())
+
+
+def _should_override(override: Optional[_ContextDecorator], field_instance: Field, model: Type[Model]) -> bool:
+    if override is not None:
+        return override.should_override_model(add=True, field_instance=field_instance, model=model)
+    return is_overridden(add=True, field_instance=field_instance, model=model)
+
+
+def _get_writer(connection, writers: Optional[Sequence[BulkWriter]]) -> BulkWriter:
+    for writer in get_default_writers() if writers is None else writers:
+        if writer.supports(connection):
+            return writer
+    raise ValueError('No bulk writer supports the %s backend' % connection.vendor)
+
+
+def _batched(rows: Iterable[Sequence[Any]], batch_size: int) -> Iterator[List[Sequence[Any]]]:
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _format_copy_row(row: Sequence[Any]) -> str:
+    return '\t'.join(_format_copy_value(value) for value in row) + '\n'
+
+
+def _format_copy_value(value: Any) -> str:
+    # PostgreSQL COPY text format
+    if value is None:
+        return '\\N'
+    return _escape_copy_text(_format_text_value(value))
+
+
+def _format_text_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        # ArrayField
+        return '{%s}' % ','.join(_format_array_element(element) for element in value)
+    if isinstance(value, dict):
+        # HStoreField
+        return ', '.join(
+            '%s=>%s' % (_quote(str(key)), 'NULL' if item is None else _quote(str(item)))
+            for key, item in value.items()
+        )
+    if hasattr(value, 'adapted') and hasattr(value, 'dumps'):
+        # psycopg2.extras.Json
+        return value.dumps(value.adapted)
+    return str(value)
+
+
+def _format_array_element(value: Any) -> str:
+    if value is None:
+        return 'NULL'
+    if isinstance(value, (list, tuple)):
+        return _format_text_value(value)
+    return _quote(_format_text_value(value))
+
+
+def _quote(value: str) -> str:
+    return '"%s"' % value.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def _escape_copy_text(value: str) -> str:
+    return (
+        value
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
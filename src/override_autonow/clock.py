@@ -0,0 +1,33 @@
+import datetime
+import threading
+import time
+from django.conf import settings
+from django.utils import timezone
+
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class MonotonicClock:
+    def __init__(self, worker_id: int = 0, worker_count: int = 1):
+        if worker_count < 1 or not 0 <= worker_id < worker_count:
+            raise ValueError('worker_id must be in range(worker_count)')
+        self.worker_id = worker_id
+        self.worker_count = worker_count
+        self._last = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> datetime.datetime:
+        now = time.time_ns() // 1000
+        with self._lock:
+            # Bump past the last issued microsecond, then onto this worker's residue class.
+            value = max(now, self._last + 1)
+            value += (self.worker_id - value) % self.worker_count
+            self._last = value
+        value = EPOCH + datetime.timedelta(microseconds=value)
+        if settings.USE_TZ:
+            return value
+        return timezone.make_naive(value)
+
+
+# Shared by every autonow_clock() without an explicit clock, so separate contexts never issue the same value.
+default_clock = MonotonicClock()
@@ -1,10 +1,16 @@
+import abc
+import contextvars
+import datetime
 import functools
 import inspect
+import threading
 import unittest
-from typing import Callable, ContextManager, Set, Tuple, Type, Union
+from typing import Callable, ContextManager, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 from django.db.models import Model
 from django.db.models.fields import DateField, DateTimeField
 
+from .clock import default_clock
+
 
 def override_autonow(
         decorate_target=None,
@@ -17,6 +23,7 @@ def override_autonow(
         exclude_models: Tuple[Type[Model]] = None,
         override_field_names: Set[str] = None,
         override_models: Tuple[Type[Model]] = None,
+        clock: Callable[[], datetime.datetime] = None,
 ) -> Union[ContextManager, Callable]:
     context_decorator = _ContextDecorator(
         exclude_auto_now=exclude_auto_now,
@@ -27,71 +34,82 @@ def override_autonow(
         exclude_models=exclude_models,
         override_field_names=override_field_names,
         override_models=override_models,
+        clock=clock,
     )
     if decorate_target is not None:
         return context_decorator(decorate_target)
     return context_decorator
 
 
-class _ContextDecorator:
-    def __init__(
-            self,
-            *,
-            exclude_auto_now: bool = False,
-            exclude_auto_now_add: bool = False,
-            exclude_date_field: bool = False,
-            exclude_datetime_field: bool = False,
-            exclude_field_names: Set[str] = None,
-            exclude_models: Tuple[Type[Model]] = None,
-            override_field_names: Set[str] = None,
-            override_models: Tuple[Type[Model]] = None,
-    ):
-        self.exclude_auto_now = exclude_auto_now
-        self.exclude_auto_now_add = exclude_auto_now_add
-        self.exclude_date_field = exclude_date_field
-        self.exclude_datetime_field = exclude_datetime_field
-        self.exclude_field_names = set() if not exclude_field_names else set(exclude_field_names)
-        self.exclude_models = tuple() if not exclude_models else tuple(exclude_models)
-        self.override_field_names = override_field_names if override_field_names is None else set(override_field_names)
-        self.override_models = override_models if override_models is None else tuple(override_models)
-        self._original_date_field_pre_save = None
-        self._original_datetime_field_pre_save = None
+def autonow_clock(
+        decorate_target=None,
+        *,
+        clock: Callable[[], datetime.datetime] = None,
+) -> Union[ContextManager, Callable]:
+    # Stamps auto fields with clock() without overriding any caller-supplied value.
+    context_decorator = _ContextDecorator(
+        exclude_date_field=True,
+        clock=default_clock if clock is None else clock,
+        override=False,
+    )
+    if decorate_target is not None:
+        return context_decorator(decorate_target)
+    return context_decorator
+
 
+class _BaseContextDecorator(abc.ABC):
     def __call__(self, target):
         if inspect.isclass(target):
             return self.decorate_class(target)
         return self.decorate_callable(target)
 
     def __enter__(self):
-        self.start()
+        # Entered contexts only apply to the current thread or task.
+        self._acquire_hooks()
+        _local_activations.set(_local_activations.get() + ((self, object()),))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
+        activations = list(_local_activations.get())
+        if _remove_last_activation(activations, self):
+            _local_activations.set(tuple(activations))
+            self._release_hooks()
 
     def start(self):
-        if not self.exclude_date_field:
-            self._original_date_field_pre_save = getattr(DateField, 'pre_save')
-            date_field_pre_save_mock = get_pre_save_mock(
-                context_decorator=self,
-                original=self._original_date_field_pre_save,
-            )
-            setattr(DateField, 'pre_save', date_field_pre_save_mock)
-
-        if not self.exclude_datetime_field:
-            self._original_datetime_field_pre_save = getattr(DateTimeField, 'pre_save')
-            datetime_field_pre_save_mock = get_pre_save_mock(
-                context_decorator=self,
-                original=self._original_datetime_field_pre_save,
-            )
-            setattr(DateTimeField, 'pre_save', datetime_field_pre_save_mock)
+        # Started contexts apply to the whole process until stop().
+        self._acquire_hooks()
+        with _hooks_lock:
+            _process_activations.append((self, object()))
 
     def stop(self):
-        if self._original_datetime_field_pre_save:
-            setattr(DateTimeField, 'pre_save', self._original_datetime_field_pre_save)
-            self._original_datetime_field_pre_save = None
-        if self._original_date_field_pre_save:
-            setattr(DateField, 'pre_save', self._original_date_field_pre_save)
-            self._original_date_field_pre_save = None
+        with _hooks_lock:
+            removed = _remove_last_activation(_process_activations, self)
+        if removed:
+            self._release_hooks()
+
+    @classmethod
+    @abc.abstractmethod
+    def install_hooks(cls):
+        pass
+
+    @classmethod
+    @abc.abstractmethod
+    def uninstall_hooks(cls):
+        pass
+
+    def _acquire_hooks(self):
+        # The hooks are installed once per class while any of its contexts is active, so exits may interleave.
+        with _hooks_lock:
+            count = _hook_counts.get(type(self), 0)
+            if count == 0:
+                type(self).install_hooks()
+            _hook_counts[type(self)] = count + 1
+
+    def _release_hooks(self):
+        with _hooks_lock:
+            count = _hook_counts[type(self)] - 1
+            _hook_counts[type(self)] = count
+            if count == 0:
+                type(self).uninstall_hooks()
 
     def decorate_class(self, _class):
         if issubclass(_class, unittest.TestCase):
@@ -140,22 +158,90 @@ class _ContextDecorator:
         functools.update_wrapper(wrapper, func)
         return wrapper
 
+
+class _ContextDecorator(_BaseContextDecorator):
+    def __init__(
+            self,
+            *,
+            exclude_auto_now: bool = False,
+            exclude_auto_now_add: bool = False,
+            exclude_date_field: bool = False,
+            exclude_datetime_field: bool = False,
+            exclude_field_names: Set[str] = None,
+            exclude_models: Tuple[Type[Model]] = None,
+            override_field_names: Set[str] = None,
+            override_models: Tuple[Type[Model]] = None,
+            clock: Callable[[], datetime.datetime] = None,
+            override: bool = True,
+    ):
+        if clock is not None and exclude_datetime_field:
+            raise ValueError('clock only applies to DateTimeField and cannot be combined with exclude_datetime_field')
+        self.exclude_auto_now = exclude_auto_now
+        self.exclude_auto_now_add = exclude_auto_now_add
+        self.exclude_date_field = exclude_date_field
+        self.exclude_datetime_field = exclude_datetime_field
+        self.exclude_field_names = set() if not exclude_field_names else set(exclude_field_names)
+        self.exclude_models = tuple() if not exclude_models else tuple(exclude_models)
+        self.override_field_names = override_field_names if override_field_names is None else set(override_field_names)
+        self.override_models = override_models if override_models is None else tuple(override_models)
+        self.clock = clock
+        self.override = override
+
+    @classmethod
+    def install_hooks(cls):
+        for field_class in (DateField, DateTimeField):
+            original = getattr(field_class, 'pre_save')
+            _original_pre_saves[field_class] = original
+            setattr(field_class, 'pre_save', get_pre_save_mock(original=original))
+
+    @classmethod
+    def uninstall_hooks(cls):
+        for field_class, original in _original_pre_saves.items():
+            setattr(field_class, 'pre_save', original)
+        _original_pre_saves.clear()
+
     def should_override(
             self,
             add: bool,
             field_instance: Union[DateField, DateTimeField],
             model_instance: Model,
     ) -> bool:
+        return self._should_override(add=add, field_instance=field_instance, model=type(model_instance))
+
+    def should_override_model(
+            self,
+            add: bool,
+            field_instance: Union[DateField, DateTimeField],
+            model: Type[Model],
+    ) -> bool:
+        # Same rules as should_override, for callers that write rows without model instances.
+        if isinstance(field_instance, DateTimeField):
+            if self.exclude_datetime_field:
+                return False
+        elif self.exclude_date_field:
+            return False
+
+        return self._should_override(add=add, field_instance=field_instance, model=model)
+
+    def _should_override(
+            self,
+            add: bool,
+            field_instance: Union[DateField, DateTimeField],
+            model: Type[Model],
+    ) -> bool:
+        if not self.override:
+            return False
+
         if field_instance.attname in self.exclude_field_names:
             return False
 
-        if isinstance(model_instance, self.exclude_models):
+        if issubclass(model, self.exclude_models):
             return False
 
         if self.override_field_names is not None and field_instance.attname not in self.override_field_names:
             return False
 
-        if self.override_models is not None and not isinstance(model_instance, self.override_models):
+        if self.override_models is not None and not issubclass(model, self.override_models):
             return False
 
         if field_instance.auto_now and self.exclude_auto_now:
@@ -167,10 +253,63 @@ class _ContextDecorator:
         return True
 
 
-def get_pre_save_mock(context_decorator: _ContextDecorator, original: Callable) -> Callable:
+ContextDecoratorT = TypeVar('ContextDecoratorT', bound=_BaseContextDecorator)
+
+_hooks_lock = threading.Lock()
+_hook_counts: Dict[type, int] = {}
+_original_pre_saves: Dict[type, Callable] = {}
+# (context decorator, activation token) pairs, outermost first
+_process_activations: List[Tuple[_BaseContextDecorator, object]] = []
+_local_activations: contextvars.ContextVar = contextvars.ContextVar('override_autonow_activations', default=())
+
+
+def _remove_last_activation(activations: List[Tuple[_BaseContextDecorator, object]], context_decorator) -> bool:
+    for index in range(len(activations) - 1, -1, -1):
+        if activations[index][0] is context_decorator:
+            del activations[index]
+            return True
+    return False
+
+
+def get_activations(context_decorator_class: Type[ContextDecoratorT]) -> List[Tuple[ContextDecoratorT, object]]:
+    return [
+        (context_decorator, token)
+        for context_decorator, token in _process_activations + list(_local_activations.get())
+        if isinstance(context_decorator, context_decorator_class)
+    ]
+
+
+def get_active_context_decorators(context_decorator_class: Type[ContextDecoratorT]) -> List[ContextDecoratorT]:
+    return [context_decorator for context_decorator, _ in get_activations(context_decorator_class)]
+
+
+def is_overridden(
+        add: bool,
+        field_instance: Union[DateField, DateTimeField],
+        model: Type[Model],
+) -> bool:
+    return any(
+        context_decorator.should_override_model(add=add, field_instance=field_instance, model=model)
+        for context_decorator in get_active_context_decorators(_ContextDecorator)
+    )
+
+
+def get_active_clock() -> Optional[Callable[[], datetime.datetime]]:
+    for context_decorator in reversed(get_active_context_decorators(_ContextDecorator)):
+        if context_decorator.clock is not None:
+            return context_decorator.clock
+    return None
+
+
+def get_pre_save_mock(original: Callable) -> Callable:
     def pre_save(self, model_instance, add):
-        if context_decorator.should_override(add=add, field_instance=self, model_instance=model_instance):
+        if is_overridden(add=add, field_instance=self, model=type(model_instance)):
             return super(DateField, self).pre_save(model_instance, add)
+        clock = get_active_clock()
+        if clock is not None and isinstance(self, DateTimeField) and (self.auto_now or (self.auto_now_add and add)):
+            value = clock()
+            setattr(model_instance, self.attname, value)
+            return value
         return original(self, model_instance, add)
 
     return pre_save
@@ -0,0 +1,23 @@
+import datetime
+from typing import Callable, List, Type, Union
+from django.db.models import Field, Model
+from django.db.models.fields import DateField, DateTimeField
+from django.utils import timezone
+
+
+def is_auto_field(field_instance: Field) -> bool:
+    return isinstance(field_instance, DateField) and bool(field_instance.auto_now or field_instance.auto_now_add)
+
+
+def get_auto_fields(model: Type[Model]) -> List[Union[DateField, DateTimeField]]:
+    return [field_instance for field_instance in model._meta.concrete_fields if is_auto_field(field_instance)]
+
+
+def get_now(
+        field_instance: Union[DateField, DateTimeField],
+        clock: Callable[[], datetime.datetime] = None,
+) -> Union[datetime.date, datetime.datetime]:
+    # Mirrors the values DateField.pre_save and DateTimeField.pre_save would stamp.
+    if isinstance(field_instance, DateTimeField):
+        return timezone.now() if clock is None else clock()
+    return datetime.date.today()
@@ -0,0 +1,223 @@
+import copy
+import datetime
+import decimal
+import uuid
+from typing import Any, Callable, ContextManager, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+from django.db.models import Field, Model
+from django.db.models.signals import post_init, post_save
+
+from .context_decorator import _BaseContextDecorator, get_activations, is_overridden
+from .fields import get_auto_fields, is_auto_field
+
+SNAPSHOT_ATTRIBUTE = '_override_autonow_snapshots'
+
+IMMUTABLE_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, decimal.Decimal, uuid.UUID,
+    datetime.date, datetime.time, datetime.timedelta,
+)
+
+DISPATCH_UID = 'override_autonow.skip_noop_saves'
+
+
+def skip_noop_saves(
+        decorate_target=None,
+        *,
+        add_auto_update_fields: bool = False,
+        exclude_models: Tuple[Type[Model]] = None,
+        override_models: Tuple[Type[Model]] = None,
+) -> Union[ContextManager, Callable]:
+    context_decorator = _SkipNoopSavesContextDecorator(
+        add_auto_update_fields=add_auto_update_fields,
+        exclude_models=exclude_models,
+        override_models=override_models,
+    )
+    if decorate_target is not None:
+        return context_decorator(decorate_target)
+    return context_decorator
+
+
+class _SkipNoopSavesContextDecorator(_BaseContextDecorator):
+    # Snapshots are keyed by the activation token, so ones left on instances by other or earlier contexts are ignored.
+
+    def __init__(
+            self,
+            *,
+            add_auto_update_fields: bool = False,
+            exclude_models: Tuple[Type[Model]] = None,
+            override_models: Tuple[Type[Model]] = None,
+    ):
+        self.add_auto_update_fields = add_auto_update_fields
+        self.exclude_models = tuple() if not exclude_models else tuple(exclude_models)
+        self.override_models = override_models if override_models is None else tuple(override_models)
+
+    @classmethod
+    def install_hooks(cls):
+        post_init.connect(_take_snapshots, weak=False, dispatch_uid=DISPATCH_UID)
+        post_save.connect(_update_snapshots, weak=False, dispatch_uid=DISPATCH_UID)
+
+        _original_model_methods['save_base'] = getattr(Model, 'save_base')
+        setattr(Model, 'save_base', get_save_base_mock(original=_original_model_methods['save_base']))
+
+        _original_model_methods['refresh_from_db'] = getattr(Model, 'refresh_from_db')
+        setattr(Model, 'refresh_from_db', get_refresh_from_db_mock(original=_original_model_methods['refresh_from_db']))
+
+    @classmethod
+    def uninstall_hooks(cls):
+        for name, original in _original_model_methods.items():
+            setattr(Model, name, original)
+        _original_model_methods.clear()
+
+        post_save.disconnect(dispatch_uid=DISPATCH_UID)
+        post_init.disconnect(dispatch_uid=DISPATCH_UID)
+
+    def should_track(self, model: Type[Model]) -> bool:
+        if issubclass(model, self.exclude_models):
+            return False
+
+        if self.override_models is not None and not issubclass(model, self.override_models):
+            return False
+
+        return True
+
+    def get_snapshot(self, instance: Model, token: object) -> Optional[Dict[str, Any]]:
+        return instance.__dict__.get(SNAPSHOT_ATTRIBUTE, {}).get(token)
+
+    def take_snapshot(self, instance: Model, token: object):
+        if not self.should_track(type(instance)):
+            return
+        instance.__dict__.setdefault(SNAPSHOT_ATTRIBUTE, {})[token] = {
+            field_instance.attname: _copy_value(instance.__dict__[field_instance.attname])
+            for field_instance in instance._meta.concrete_fields
+            if field_instance.attname in instance.__dict__
+        }
+
+    def update_snapshot(self, instance: Model, token: object, update_fields: Optional[Iterable[str]]):
+        snapshot = self.get_snapshot(instance, token)
+        if update_fields is None or snapshot is None:
+            self.take_snapshot(instance, token)
+            return
+        # Fields left out of update_fields were not written, so their snapshot stays as loaded.
+        for field_name in update_fields:
+            field_instance = instance._meta.get_field(field_name)
+            if field_instance.attname in instance.__dict__:
+                snapshot[field_instance.attname] = _copy_value(instance.__dict__[field_instance.attname])
+
+    def refresh_snapshot(self, instance: Model, token: object, fields: Optional[Iterable[str]]):
+        # Values loaded by refresh_from_db(), including deferred fields, match the database again.
+        if self.get_snapshot(instance, token) is None:
+            return
+        if fields is None:
+            self.take_snapshot(instance, token)
+        else:
+            self.update_snapshot(instance, token, update_fields=fields)
+
+    def get_changed_fields(
+            self,
+            model_instance: Model,
+            token: object,
+            update_fields: Optional[Iterable[str]],
+    ) -> Optional[List[Field]]:
+        # Returns None when the instance has no snapshot to compare with.
+        snapshot = self.get_snapshot(model_instance, token)
+        if snapshot is None or model_instance._state.adding:
+            return None
+
+        changed_fields = []
+        for field_instance in type(model_instance)._meta.concrete_fields:
+            if update_fields is not None and field_instance.name not in update_fields \
+                    and field_instance.attname not in update_fields:
+                continue
+            if field_instance.attname not in model_instance.__dict__:
+                continue
+            if field_instance.attname not in snapshot \
+                    or snapshot[field_instance.attname] != model_instance.__dict__[field_instance.attname]:
+                changed_fields.append(field_instance)
+        return changed_fields
+
+    def is_noop_save(self, model_instance: Model, token: object, update_fields: Optional[FrozenSet[str]]) -> bool:
+        changed_fields = self.get_changed_fields(model_instance, token, update_fields)
+        if changed_fields is None:
+            return False
+
+        # Saving only auto_now fields on purpose, e.g. save(update_fields=['updated_at']), is a touch.
+        if update_fields is not None and all(
+                _is_bumped(model_instance._meta.get_field(field_name)) for field_name in update_fields
+        ):
+            return False
+
+        model = type(model_instance)
+        for field_instance in changed_fields:
+            # A changed auto_now field would be overwritten anyway, unless override_autonow keeps the caller's value.
+            if not _is_bumped(field_instance) or is_overridden(add=False, field_instance=field_instance, model=model):
+                return False
+        return True
+
+    def get_update_fields(self, model_instance: Model, token: object, update_fields: FrozenSet[str]) -> FrozenSet[str]:
+        model = type(model_instance)
+        changed_fields = self.get_changed_fields(model_instance, token, None) or []
+        auto_update_fields = set()
+        for field_instance in get_auto_fields(model):
+            if field_instance in changed_fields:
+                auto_update_fields.add(field_instance.name)
+            elif _is_bumped(field_instance) and not is_overridden(add=False, field_instance=field_instance, model=model):
+                auto_update_fields.add(field_instance.name)
+        return frozenset(update_fields) | auto_update_fields
+
+
+_original_model_methods: Dict[str, Callable] = {}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+def _is_bumped(field_instance: Field) -> bool:
+    return is_auto_field(field_instance) and field_instance.auto_now
+
+
+def _take_snapshots(sender: Type[Model], instance: Model, **kwargs):
+    for context_decorator, token in get_activations(_SkipNoopSavesContextDecorator):
+        context_decorator.take_snapshot(instance, token)
+
+
+def _update_snapshots(sender: Type[Model], instance: Model, update_fields: Optional[Iterable[str]] = None, **kwargs):
+    for context_decorator, token in get_activations(_SkipNoopSavesContextDecorator):
+        context_decorator.update_snapshot(instance, token, update_fields)
+
+
+def get_save_base_mock(original: Callable) -> Callable:
+    def save_base(self, raw=False, force_insert=False, force_update=False, using=None, update_fields=None):
+        if not raw and not force_insert and not force_update:
+            activations = [
+                (context_decorator, token)
+                for context_decorator, token in get_activations(_SkipNoopSavesContextDecorator)
+                if context_decorator.should_track(type(self))
+            ]
+            for context_decorator, token in activations:
+                if context_decorator.is_noop_save(self, token, update_fields):
+                    return
+            for context_decorator, token in activations:
+                if context_decorator.add_auto_update_fields and update_fields is not None:
+                    update_fields = context_decorator.get_update_fields(self, token, update_fields)
+        return original(
+            self,
+            raw=raw,
+            force_insert=force_insert,
+            force_update=force_update,
+            using=using,
+            update_fields=update_fields,
+        )
+
+    return save_base
+
+
+def get_refresh_from_db_mock(original: Callable) -> Callable:
+    def refresh_from_db(self, using=None, fields=None, *args, **kwargs):
+        result = original(self, using, fields, *args, **kwargs)
+        for context_decorator, token in get_activations(_SkipNoopSavesContextDecorator):
+            context_decorator.refresh_snapshot(self, token, fields)
+        return result
+
+    return refresh_from_db
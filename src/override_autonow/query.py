@@ -0,0 +1,45 @@
+import datetime
+from django.db.models import Manager, QuerySet
+from django.db.models.fields import DateTimeField
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from .context_decorator import get_active_clock, is_overridden
+from .fields import get_auto_fields
+
+
+class AutoNowQuerySetMixin:
+    # Stamp DateTimeFields with the database's Now() instead of a value computed in Python.
+    use_database_now = False
+
+    def update(self, **kwargs):
+        kwargs.update(self.get_auto_now_values(kwargs))
+        return super().update(**kwargs)
+
+    def get_auto_now_values(self, kwargs):
+        values = {}
+        now = None
+        for field_instance in get_auto_fields(self.model):
+            if not field_instance.auto_now:
+                continue
+            # Like pre_save, an overridden field keeps the caller's value or is left as it is.
+            if is_overridden(add=False, field_instance=field_instance, model=self.model):
+                continue
+            if not isinstance(field_instance, DateTimeField):
+                values[field_instance.name] = datetime.date.today()
+                continue
+            if now is None:
+                clock = get_active_clock()
+                if self.use_database_now and clock is None:
+                    now = Now()
+                else:
+                    now = timezone.now() if clock is None else clock()
+            values[field_instance.name] = now
+        return values
+
+
+class AutoNowQuerySet(AutoNowQuerySetMixin, QuerySet):
+    pass
+
+
+AutoNowManager = Manager.from_queryset(AutoNowQuerySet, 'AutoNowManager')
@@ -0,0 +1,77 @@
+import contextlib
+import datetime
+from typing import Any, Callable, Iterator, List, Union
+from django.db import router, transaction
+from django.db.models import F, QuerySet
+from django.db.models.expressions import Combinable
+
+from .context_decorator import _ContextDecorator, get_active_context_decorators, is_overridden
+from .fields import is_auto_field
+
+Value = Union[Combinable, datetime.timedelta, datetime.date, Callable[[F], Any]]
+
+
+def retimestamp(
+        queryset: QuerySet,
+        field: str,
+        value: Value,
+        *,
+        override: _ContextDecorator = None,
+        batch_size: int = 1000,
+        atomic: bool = False,
+) -> int:
+    model = queryset.model
+    field_instance = model._meta.get_field(field)
+    if not is_auto_field(field_instance):
+        raise ValueError('%s.%s is not an auto_now or auto_now_add field' % (model._meta.object_name, field))
+
+    # The caller sets the value explicitly, so add=True lets exclude_auto_now_add protect auto_now_add fields too.
+    if override is not None:
+        allowed = override.should_override_model(add=True, field_instance=field_instance, model=model)
+    elif get_active_context_decorators(_ContextDecorator):
+        allowed = is_overridden(add=True, field_instance=field_instance, model=model)
+    else:
+        allowed = True
+    if not allowed:
+        raise ValueError('%s.%s is excluded from override' % (model._meta.object_name, field))
+
+    if isinstance(value, datetime.timedelta):
+        expression = F(field_instance.attname) + value
+    elif callable(value) and not isinstance(value, Combinable):
+        expression = value(F(field_instance.attname))
+    else:
+        expression = value
+
+    # Resolved like QuerySet.update(), so the pks are read from and written to the primary.
+    using = queryset._db or router.db_for_write(model, **queryset._hints)
+    queryset = queryset.using(using)
+    # Plain update() through _base_manager, so custom manager behaviour does not leak into the UPDATE.
+    base_queryset = model._base_manager.using(using)
+    if not batch_size:
+        return base_queryset.filter(pk__in=queryset.values('pk')).update(**{field_instance.attname: expression})
+
+    # Each chunk commits on its own to keep lock time short, unless atomic=True asks for all or nothing.
+    with transaction.atomic(using=using) if atomic else contextlib.nullcontext():
+        return sum(
+            base_queryset.filter(pk__in=chunk).update(**{field_instance.attname: expression})
+            for chunk in _get_pk_chunks(queryset, batch_size)
+        )
+
+
+def _get_pk_chunks(queryset: QuerySet, batch_size: int) -> Iterator[List[Any]]:
+    if not queryset.query.can_filter():
+        # A sliced queryset can't be reordered or filtered further, so its pks are read at once.
+        pks = list(queryset.values_list('pk', flat=True))
+        for start in range(0, len(pks), batch_size):
+            yield pks[start:start + batch_size]
+        return
+
+    pks = queryset.order_by('pk').values_list('pk', flat=True)
+    last_pk = None
+    while True:
+        chunk = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        chunk = list(chunk[:batch_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1]
@@ -0,0 +1,251 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from override_autonow import BulkWriter, CopyWriter, ExecuteManyWriter, bulk_load, override_autonow
+from override_autonow.bulk import _format_copy_row
+
+from .test_context_decorator import TestOverrideMixin
+from .testapp.models import AutoFieldsModel, AutoFieldsModel2, DefaultFieldsModel
+
+AUTO_FIELD_NAMES = ['date_auto_now', 'date_auto_now_add', 'datetime_auto_now', 'datetime_auto_now_add']
+
+
+class RecordingWriter(ExecuteManyWriter):
+    def __init__(self):
+        super().__init__()
+        self.columns = None
+
+    def write(self, connection, table, columns, rows):
+        self.columns = list(columns)
+        return super().write(connection, table, columns, rows)
+
+
+class RecordingRouter:
+    models = []
+
+    def db_for_write(self, model, **hints):
+        self.models.append(model)
+        return 'default'
+
+
+class TestBulkLoad(TestOverrideMixin, TestCase):
+    def test_tuple_rows_with_override(self):
+        with override_autonow():
+            count = bulk_load(AutoFieldsModel, [(None, None, None, None)] * 3, fields=AUTO_FIELD_NAMES)
+
+        self.assertEqual(count, 3)
+        for obj in AutoFieldsModel.objects.all():
+            self.assertIsOverridden(obj.date_auto_now)
+            self.assertIsOverridden(obj.date_auto_now_add)
+            self.assertIsOverridden(obj.datetime_auto_now)
+            self.assertIsOverridden(obj.datetime_auto_now_add)
+
+    def test_without_override(self):
+        bulk_load(AutoFieldsModel, [(None, None, None, None)], fields=AUTO_FIELD_NAMES)
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsNotOverridden(obj.date_auto_now)
+        self.assertIsNotOverridden(obj.date_auto_now_add)
+        self.assertIsNotOverridden(obj.datetime_auto_now)
+        self.assertIsNotOverridden(obj.datetime_auto_now_add)
+
+    def test_dict_rows(self):
+        value = datetime.date(2022, 1, 1)
+        with override_autonow():
+            bulk_load(AutoFieldsModel, [{'date_auto_now': value, 'date_auto_now_add': None}])
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertEqual(obj.date_auto_now, value)
+        self.assertIsOverridden(obj.date_auto_now_add)
+        self.assertIsOverridden(obj.datetime_auto_now)
+        self.assertIsOverridden(obj.datetime_auto_now_add)
+
+    def test_unsupplied_auto_fields_are_stamped(self):
+        bulk_load(AutoFieldsModel, [{'date_auto_now': None}])
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsNotOverridden(obj.date_auto_now)
+        self.assertIsNotOverridden(obj.date_auto_now_add)
+        self.assertIsNotOverridden(obj.datetime_auto_now)
+        self.assertIsNotOverridden(obj.datetime_auto_now_add)
+
+    def test_override_argument(self):
+        bulk_load(
+            AutoFieldsModel,
+            [(None, None, None, None)],
+            fields=AUTO_FIELD_NAMES,
+            override=override_autonow(exclude_auto_now=True),
+        )
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsNotOverridden(obj.date_auto_now)
+        self.assertIsOverridden(obj.date_auto_now_add)
+        self.assertIsNotOverridden(obj.datetime_auto_now)
+        self.assertIsOverridden(obj.datetime_auto_now_add)
+
+    def test_exclude_date_field(self):
+        with override_autonow(exclude_date_field=True):
+            bulk_load(AutoFieldsModel, [(None, None, None, None)], fields=AUTO_FIELD_NAMES)
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsNotOverridden(obj.date_auto_now)
+        self.assertIsNotOverridden(obj.date_auto_now_add)
+        self.assertIsOverridden(obj.datetime_auto_now)
+        self.assertIsOverridden(obj.datetime_auto_now_add)
+
+    def test_exclude_models(self):
+        with override_autonow(exclude_models=(AutoFieldsModel2,)):
+            bulk_load(AutoFieldsModel, [(None, None, None, None)], fields=AUTO_FIELD_NAMES)
+            bulk_load(AutoFieldsModel2, [(None, None, None, None)], fields=AUTO_FIELD_NAMES)
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsOverridden(obj.date_auto_now)
+        self.assertIsOverridden(obj.datetime_auto_now_add)
+        obj2 = AutoFieldsModel2.objects.get()
+        self.assertIsNotOverridden(obj2.date_auto_now)
+        self.assertIsNotOverridden(obj2.datetime_auto_now_add)
+
+    def test_empty_rows(self):
+        self.assertEqual(bulk_load(AutoFieldsModel, []), 0)
+
+    def test_wrong_row_length(self):
+        with self.assertRaises(ValueError):
+            bulk_load(AutoFieldsModel, [(None,)], fields=AUTO_FIELD_NAMES)
+
+    def test_missing_dict_key(self):
+        with override_autonow():
+            with self.assertRaises(ValueError):
+                bulk_load(AutoFieldsModel, [{'date_auto_now': None}], fields=['date_auto_now', 'date_auto_now_add'])
+
+    def test_missing_dict_key_of_stamped_field(self):
+        bulk_load(AutoFieldsModel, [{'date_auto_now': None}], fields=['date_auto_now', 'date_auto_now_add'])
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertIsNotOverridden(obj.date_auto_now_add)
+
+    def test_omitted_field_default(self):
+        bulk_load(DefaultFieldsModel, [{'datetime_auto_now_add': None}])
+        bulk_load(DefaultFieldsModel, [{'status': 'PAID'}])
+
+        self.assertEqual(list(DefaultFieldsModel.objects.order_by('pk').values_list('status', flat=True)), ['NEW', 'PAID'])
+
+    @override_settings(DATABASE_ROUTERS=['tests.test_bulk.RecordingRouter'])
+    def test_router(self):
+        RecordingRouter.models.clear()
+        bulk_load(AutoFieldsModel, [{'date_auto_now': None}])
+
+        self.assertEqual(RecordingRouter.models, [AutoFieldsModel])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            bulk_load(AutoFieldsModel, [{'unknown': None}])
+
+    def test_writer_fallback(self):
+        writer = RecordingWriter()
+        with override_autonow(override_field_names={'date_auto_now'}):
+            bulk_load(AutoFieldsModel, [(None, None)], fields=['date_auto_now', 'date_auto_now_add'], writers=(CopyWriter(), writer))
+
+        self.assertFalse(CopyWriter().supports(connection))
+        self.assertEqual(writer.columns, AUTO_FIELD_NAMES)
+        self.assertEqual(AutoFieldsModel.objects.count(), 1)
+
+
+class FakeCursor:
+    def __init__(self):
+        self.sql = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class FakePsycopg2Cursor(FakeCursor):
+    def __init__(self):
+        super().__init__()
+        self.data = ''
+
+    def copy_expert(self, sql, file):
+        self.sql = sql
+        self.data += file.read()
+
+
+class FakeCopy:
+    def __init__(self):
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def write_row(self, row):
+        self.rows.append(row)
+
+
+class FakePsycopg3Cursor(FakeCursor):
+    def __init__(self):
+        super().__init__()
+        self.fake_copy = FakeCopy()
+
+    def copy(self, sql):
+        self.sql = sql
+        return self.fake_copy
+
+
+class FakeConnection:
+    vendor = 'postgresql'
+
+    def __init__(self, cursor):
+        self.ops = connection.ops
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+class TestBulkWriter(TestCase):
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            BulkWriter()
+
+
+class TestCopyWriter(TestCase):
+    def test_write_psycopg2(self):
+        cursor = FakePsycopg2Cursor()
+        count = CopyWriter(batch_size=1).write(FakeConnection(cursor), 'table', ['a', 'b'], [(1, None), (2, 'x')])
+
+        self.assertEqual(count, 2)
+        self.assertEqual(cursor.sql, 'COPY "table" ("a", "b") FROM STDIN')
+        self.assertEqual(cursor.data, '1\t\\N\n2\tx\n')
+
+    def test_write_psycopg3(self):
+        cursor = FakePsycopg3Cursor()
+        count = CopyWriter().write(FakeConnection(cursor), 'table', ['a'], [(1,), (2,)])
+
+        self.assertEqual(count, 2)
+        self.assertEqual(cursor.sql, 'COPY "table" ("a") FROM STDIN')
+        self.assertEqual(cursor.fake_copy.rows, [(1,), (2,)])
+
+    def test_format_copy_row(self):
+        row = (None, True, 'a\tb\nc\\d', datetime.datetime(2022, 1, 1, 12, 0), b'\x00\xff', 1)
+
+        self.assertEqual(
+            _format_copy_row(row),
+            '\\N\tt\ta\\tb\\nc\\\\d\t2022-01-01T12:00:00\t\\\\x00ff\t1\n',
+        )
+
+    def test_format_array(self):
+        self.assertEqual(
+            _format_copy_row(([1, None, 'a"b'], [[1, 2], [3, 4]], [])),
+            '{"1",NULL,"a\\\\"b"}\t{{"1","2"},{"3","4"}}\t{}\n',
+        )
+
+    def test_format_hstore(self):
+        self.assertEqual(
+            _format_copy_row(({'a': '1', 'b': None},)),
+            '"a"=>"1", "b"=>NULL\n',
+        )
@@ -0,0 +1,107 @@
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from override_autonow import MonotonicClock, autonow_clock, bulk_load, override_autonow
+
+from .testapp.models import AutoFieldsModel
+
+VALUE = datetime.datetime(2022, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestMonotonicClock(TestCase):
+    def test_strictly_increasing(self):
+        clock = MonotonicClock()
+        with mock.patch('override_autonow.clock.time.time_ns', return_value=int(VALUE.timestamp()) * 10 ** 9):
+            values = [clock() for _ in range(3)]
+
+        self.assertEqual(values, [VALUE + datetime.timedelta(microseconds=i) for i in range(3)])
+
+    def test_clock_going_backwards(self):
+        clock = MonotonicClock()
+        with mock.patch('override_autonow.clock.time.time_ns', return_value=int(VALUE.timestamp()) * 10 ** 9):
+            first = clock()
+        with mock.patch('override_autonow.clock.time.time_ns', return_value=int(VALUE.timestamp() - 60) * 10 ** 9):
+            second = clock()
+
+        self.assertEqual(second, first + datetime.timedelta(microseconds=1))
+
+    def test_worker_offset(self):
+        clocks = [MonotonicClock(worker_id=worker_id, worker_count=3) for worker_id in range(3)]
+        with mock.patch('override_autonow.clock.time.time_ns', return_value=int(VALUE.timestamp()) * 10 ** 9):
+            values = [clock() for clock in clocks for _ in range(4)]
+
+        self.assertEqual(len(set(values)), len(values))
+        for worker_id, clock in enumerate(clocks):
+            self.assertEqual(clock._last % 3, worker_id)
+
+    def test_invalid_worker_id(self):
+        with self.assertRaises(ValueError):
+            MonotonicClock(worker_id=3, worker_count=3)
+
+
+class TestOverrideAutonowClock(TestCase):
+    def test_clock(self):
+        with autonow_clock():
+            objs = [AutoFieldsModel.objects.create() for _ in range(10)]
+
+        values = [obj.datetime_auto_now_add for obj in objs]
+        self.assertEqual(values, sorted(set(values)))
+        self.assertIsNotNone(objs[0].date_auto_now_add)
+
+    def test_clock_with_override(self):
+        with override_autonow(override_field_names={'datetime_auto_now'}, clock=lambda: VALUE):
+            obj = AutoFieldsModel.objects.create()
+
+        self.assertIsNone(obj.datetime_auto_now)
+        self.assertEqual(obj.datetime_auto_now_add, VALUE)
+
+    def test_nested_override(self):
+        with override_autonow(override_field_names={'datetime_auto_now'}):
+            with autonow_clock(clock=lambda: VALUE):
+                obj = AutoFieldsModel.objects.create()
+
+        self.assertIsNone(obj.datetime_auto_now)
+        self.assertEqual(obj.datetime_auto_now_add, VALUE)
+
+    def test_save(self):
+        with autonow_clock(clock=lambda: VALUE):
+            obj = AutoFieldsModel.objects.create()
+            obj.datetime_auto_now_add = None
+            obj.save()
+
+        self.assertIsNone(obj.datetime_auto_now_add)
+        self.assertEqual(obj.datetime_auto_now, VALUE)
+
+    def test_separate_contexts(self):
+        with mock.patch('override_autonow.clock.time.time_ns', return_value=int(VALUE.timestamp()) * 10 ** 9):
+            with autonow_clock():
+                obj1 = AutoFieldsModel.objects.create()
+            with autonow_clock():
+                obj2 = AutoFieldsModel.objects.create()
+
+        self.assertLess(obj1.datetime_auto_now_add, obj2.datetime_auto_now_add)
+
+    def test_caller_value_is_not_kept(self):
+        with autonow_clock(clock=lambda: VALUE):
+            obj = AutoFieldsModel.objects.create(datetime_auto_now=None)
+
+        self.assertEqual(obj.datetime_auto_now, VALUE)
+
+    def test_exclude_datetime_field(self):
+        with self.assertRaises(ValueError):
+            override_autonow(exclude_datetime_field=True, clock=MonotonicClock())
+
+    @autonow_clock(clock=lambda: VALUE)
+    def test_method_decorator(self):
+        obj = AutoFieldsModel.objects.create()
+
+        self.assertEqual(obj.datetime_auto_now_add, VALUE)
+        self.assertIsNotNone(obj.date_auto_now_add)
+
+    def test_bulk_load(self):
+        with autonow_clock():
+            bulk_load(AutoFieldsModel, [{'date_auto_now': None}] * 10)
+
+        values = list(AutoFieldsModel.objects.order_by('pk').values_list('datetime_auto_now_add', flat=True))
+        self.assertEqual(values, sorted(set(values)))
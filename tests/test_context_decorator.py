@@ -1,4 +1,7 @@
+import threading
+
 import pytest
+from django.db.models import DateTimeField
 from django.test import TestCase
 from override_autonow import override_autonow
 
@@ -492,3 +495,39 @@ class TestPytestWithNestedClassDecorators:
         assert_is_overridden(obj2.date_auto_now_add)
         assert_is_overridden(obj2.datetime_auto_now)
         assert_is_overridden(obj2.datetime_auto_now_add)
+
+
+class TestActivation(TestCase):
+    def pre_save_in_thread(self):
+        field_instance = AutoFieldsModel._meta.get_field('datetime_auto_now')
+        results = []
+        thread = threading.Thread(target=lambda: results.append(field_instance.pre_save(AutoFieldsModel(), add=True)))
+        thread.start()
+        thread.join()
+        return results[0]
+
+    def test_interleaved_stop(self):
+        original = DateTimeField.pre_save
+        context_decorator1 = override_autonow()
+        context_decorator2 = override_autonow()
+        context_decorator1.start()
+        context_decorator2.start()
+        context_decorator1.stop()
+        self.assertIsNot(DateTimeField.pre_save, original)
+        context_decorator2.stop()
+
+        self.assertIs(DateTimeField.pre_save, original)
+
+    def test_context_manager_is_local(self):
+        with override_autonow():
+            self.assertIsNotNone(self.pre_save_in_thread())
+
+    def test_start_is_process_wide(self):
+        context_decorator = override_autonow()
+        context_decorator.start()
+        try:
+            value = self.pre_save_in_thread()
+        finally:
+            context_decorator.stop()
+
+        self.assertIsNone(value)
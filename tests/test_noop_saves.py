@@ -0,0 +1,223 @@
+import datetime
+import threading
+
+from django.db import connection
+from django.db.models import Model
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from override_autonow import override_autonow, skip_noop_saves
+
+from .testapp.models import AutoFieldsModel, AutoFieldsModel2
+
+VALUE = datetime.datetime(2022, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestSkipNoopSaves(TestCase):
+    def setUp(self):
+        with override_autonow():
+            AutoFieldsModel.objects.create(datetime_auto_now=VALUE, datetime_auto_now_add=VALUE)
+            AutoFieldsModel2.objects.create(datetime_auto_now=VALUE, datetime_auto_now_add=VALUE)
+
+    def test_unchanged_instance(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            with CaptureQueriesContext(connection) as queries:
+                obj.save()
+
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(obj.datetime_auto_now, VALUE)
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+    def test_changed_instance(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.date_auto_now_add = VALUE.date()
+            obj.save()
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertEqual(obj.date_auto_now_add, VALUE.date())
+        self.assertNotEqual(obj.datetime_auto_now, VALUE)
+
+    def test_changed_auto_now_field_only(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.datetime_auto_now = VALUE + datetime.timedelta(days=1)
+            obj.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+    def test_changed_auto_field_with_override(self):
+        with skip_noop_saves(), override_autonow():
+            obj = AutoFieldsModel.objects.get()
+            obj.datetime_auto_now = VALUE + datetime.timedelta(days=1)
+            obj.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE + datetime.timedelta(days=1))
+
+    def test_saved_instance(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.create()
+            with CaptureQueriesContext(connection) as queries:
+                obj.save()
+
+        self.assertEqual(len(queries), 0)
+
+    def test_update_fields(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.date_auto_now_add = VALUE.date()
+            obj.save(update_fields=['date_auto_now_add'])
+            with CaptureQueriesContext(connection) as queries:
+                obj.save(update_fields=['date_auto_now_add'])
+
+        self.assertEqual(len(queries), 0)
+        obj = AutoFieldsModel.objects.get()
+        self.assertEqual(obj.date_auto_now_add, VALUE.date())
+        self.assertEqual(obj.datetime_auto_now, VALUE)
+
+    def test_fields_left_out_of_update_fields(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.date_auto_now_add = VALUE.date()
+            obj.save(update_fields=['date_auto_now'])
+            obj.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().date_auto_now_add, VALUE.date())
+
+    def test_touch(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.save(update_fields=['datetime_auto_now'])
+
+        self.assertNotEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+    def test_add_auto_update_fields(self):
+        with skip_noop_saves(add_auto_update_fields=True):
+            obj = AutoFieldsModel.objects.get()
+            obj.date_auto_now_add = VALUE.date()
+            obj.save(update_fields=['date_auto_now_add'])
+
+        obj = AutoFieldsModel.objects.get()
+        self.assertEqual(obj.date_auto_now_add, VALUE.date())
+        self.assertNotEqual(obj.datetime_auto_now, VALUE)
+        self.assertEqual(obj.datetime_auto_now_add, VALUE)
+
+    def test_exclude_models(self):
+        with skip_noop_saves(exclude_models=(AutoFieldsModel2,)):
+            obj = AutoFieldsModel.objects.get()
+            obj2 = AutoFieldsModel2.objects.get()
+            obj.save()
+            obj2.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+        self.assertNotEqual(AutoFieldsModel2.objects.get().datetime_auto_now, VALUE)
+
+    def test_override_models(self):
+        with skip_noop_saves(override_models=(AutoFieldsModel2,)):
+            obj = AutoFieldsModel.objects.get()
+            obj2 = AutoFieldsModel2.objects.get()
+            obj.save()
+            obj2.save()
+
+        self.assertNotEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+        self.assertEqual(AutoFieldsModel2.objects.get().datetime_auto_now, VALUE)
+
+    def test_refresh_from_db(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            AutoFieldsModel.objects.update(date_auto_now_add=VALUE.date())
+            obj.refresh_from_db()
+            obj.date_auto_now_add = None
+            obj.save()
+
+        self.assertIsNone(AutoFieldsModel.objects.get().date_auto_now_add)
+
+    def test_refresh_from_db_fields(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+            obj.datetime_auto_now_add = VALUE + datetime.timedelta(days=1)
+            obj.refresh_from_db(fields=['date_auto_now_add'])
+            obj.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now_add, VALUE + datetime.timedelta(days=1))
+
+    def test_deferred_field(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.defer('date_auto_now_add').get()
+            AutoFieldsModel.objects.update(date_auto_now_add=VALUE.date())
+            self.assertEqual(obj.date_auto_now_add, VALUE.date())
+            obj.date_auto_now_add = None
+            obj.save()
+
+        self.assertIsNone(AutoFieldsModel.objects.get().date_auto_now_add)
+
+    def test_snapshot_of_previous_context(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+        obj.date_auto_now_add = VALUE.date()
+        obj.save()
+        with skip_noop_saves():
+            obj.date_auto_now_add = None
+            obj.save()
+
+        self.assertIsNone(AutoFieldsModel.objects.get().date_auto_now_add)
+
+    def test_after_context_manager(self):
+        with skip_noop_saves():
+            obj = AutoFieldsModel.objects.get()
+        obj.save()
+
+        self.assertNotEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+    @skip_noop_saves
+    def test_method_decorator(self):
+        obj = AutoFieldsModel.objects.get()
+        obj.save()
+
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+
+class TestActivation(TestCase):
+    def setUp(self):
+        with override_autonow():
+            AutoFieldsModel.objects.create(datetime_auto_now=VALUE, datetime_auto_now_add=VALUE)
+
+    def has_snapshot_in_thread(self):
+        results = []
+        thread = threading.Thread(target=lambda: results.append('_override_autonow_snapshots' in AutoFieldsModel().__dict__))
+        thread.start()
+        thread.join()
+        return results[0]
+
+    def test_interleaved_stop(self):
+        save_base = Model.save_base
+        refresh_from_db = Model.refresh_from_db
+        context_decorator1 = skip_noop_saves()
+        context_decorator2 = skip_noop_saves()
+        context_decorator1.start()
+        context_decorator2.start()
+        context_decorator1.stop()
+        obj = AutoFieldsModel.objects.get()
+        obj.save()
+        self.assertEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+        context_decorator2.stop()
+
+        self.assertIs(Model.save_base, save_base)
+        self.assertIs(Model.refresh_from_db, refresh_from_db)
+        obj.save()
+        self.assertNotEqual(AutoFieldsModel.objects.get().datetime_auto_now, VALUE)
+
+    def test_context_manager_is_local(self):
+        with skip_noop_saves():
+            self.assertIn('_override_autonow_snapshots', AutoFieldsModel().__dict__)
+            self.assertFalse(self.has_snapshot_in_thread())
+
+    def test_start_is_process_wide(self):
+        context_decorator = skip_noop_saves()
+        context_decorator.start()
+        try:
+            value = self.has_snapshot_in_thread()
+        finally:
+            context_decorator.stop()
+
+        self.assertTrue(value)
@@ -0,0 +1,87 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from override_autonow import AutoNowQuerySet, autonow_clock, override_autonow
+
+from .testapp.models import AutoFieldsModel
+
+VALUE = datetime.datetime(2022, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class DatabaseNowQuerySet(AutoNowQuerySet):
+    use_database_now = True
+
+
+class TestAutoNowQuerySet(TestCase):
+    def setUp(self):
+        with override_autonow():
+            for _ in range(3):
+                AutoFieldsModel.objects.create(
+                    date_auto_now=VALUE.date(),
+                    date_auto_now_add=VALUE.date(),
+                    datetime_auto_now=VALUE,
+                    datetime_auto_now_add=VALUE,
+                )
+
+    def test_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            count = AutoNowQuerySet(AutoFieldsModel).update(date_auto_now_add=None)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(len(queries), 1)
+        values = set()
+        for obj in AutoFieldsModel.objects.all():
+            self.assertIsNone(obj.date_auto_now_add)
+            self.assertEqual(obj.datetime_auto_now_add, VALUE)
+            self.assertNotEqual(obj.date_auto_now, VALUE.date())
+            self.assertNotEqual(obj.datetime_auto_now, VALUE)
+            values.add(obj.datetime_auto_now)
+        self.assertEqual(len(values), 1)
+
+    def test_caller_value_without_override(self):
+        AutoNowQuerySet(AutoFieldsModel).update(datetime_auto_now=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertIsNotNone(obj.datetime_auto_now)
+
+    def test_override(self):
+        with override_autonow():
+            AutoNowQuerySet(AutoFieldsModel).update(datetime_auto_now=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertEqual(obj.date_auto_now, VALUE.date())
+            self.assertIsNone(obj.datetime_auto_now)
+
+    def test_override_field_names(self):
+        with override_autonow(override_field_names={'datetime_auto_now'}):
+            AutoNowQuerySet(AutoFieldsModel).update(datetime_auto_now=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertNotEqual(obj.date_auto_now, VALUE.date())
+            self.assertIsNone(obj.datetime_auto_now)
+
+    def test_exclude_datetime_field(self):
+        with override_autonow(exclude_datetime_field=True):
+            AutoNowQuerySet(AutoFieldsModel).update(date_auto_now=None, datetime_auto_now=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertIsNone(obj.date_auto_now)
+            self.assertIsNotNone(obj.datetime_auto_now)
+            self.assertNotEqual(obj.datetime_auto_now, VALUE)
+
+    def test_clock(self):
+        clock_value = VALUE + datetime.timedelta(days=1)
+        with autonow_clock(clock=lambda: clock_value):
+            AutoNowQuerySet(AutoFieldsModel).update(date_auto_now_add=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertEqual(obj.datetime_auto_now, clock_value)
+
+    def test_database_now(self):
+        DatabaseNowQuerySet(AutoFieldsModel).update(date_auto_now_add=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertIsNotNone(obj.datetime_auto_now)
+            self.assertNotEqual(obj.datetime_auto_now, VALUE)
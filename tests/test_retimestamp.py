@@ -0,0 +1,148 @@
+import datetime
+from unittest import mock
+
+from django.db.models import F, QuerySet
+from django.db.models.functions import Coalesce
+from django.test import TestCase, override_settings
+from override_autonow import override_autonow, retimestamp
+
+from .testapp.models import AutoFieldsModel, AutoFieldsModel2
+
+VALUE = datetime.datetime(2022, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class RecordingRouter:
+    calls = []
+
+    def db_for_read(self, model, **hints):
+        self.calls.append('read')
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        self.calls.append('write')
+        return 'default'
+
+
+class TestRetimestamp(TestCase):
+    def setUp(self):
+        with override_autonow():
+            self.objs = [
+                AutoFieldsModel.objects.create(datetime_auto_now=VALUE, datetime_auto_now_add=VALUE)
+                for _ in range(5)
+            ]
+        self.other = AutoFieldsModel2.objects.create()
+
+    def test_timedelta(self):
+        count = retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now_add', datetime.timedelta(days=1), batch_size=2)
+
+        self.assertEqual(count, 5)
+        for obj in AutoFieldsModel.objects.all():
+            self.assertEqual(obj.datetime_auto_now_add, VALUE + datetime.timedelta(days=1))
+            self.assertEqual(obj.datetime_auto_now, VALUE)
+
+    def test_queryset_filter(self):
+        pks = [obj.pk for obj in self.objs[:2]]
+        count = retimestamp(AutoFieldsModel.objects.filter(pk__in=pks), 'datetime_auto_now', datetime.timedelta(hours=-1))
+
+        self.assertEqual(count, 2)
+        self.assertEqual(AutoFieldsModel.objects.filter(datetime_auto_now=VALUE).count(), 3)
+
+    def test_expression(self):
+        retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', F('datetime_auto_now_add'), batch_size=None)
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertEqual(obj.datetime_auto_now, obj.datetime_auto_now_add)
+
+    def test_callable(self):
+        retimestamp(AutoFieldsModel.objects.all(), 'date_auto_now', lambda field: Coalesce(field, VALUE.date()))
+
+        for obj in AutoFieldsModel.objects.all():
+            self.assertEqual(obj.date_auto_now, VALUE.date())
+
+    def test_value(self):
+        retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', VALUE + datetime.timedelta(days=2))
+
+        self.assertEqual(AutoFieldsModel.objects.filter(datetime_auto_now=VALUE + datetime.timedelta(days=2)).count(), 5)
+
+    def test_not_auto_field(self):
+        with self.assertRaises(ValueError):
+            retimestamp(AutoFieldsModel.objects.all(), 'id', 1)
+
+    def test_excluded_field(self):
+        with self.assertRaises(ValueError):
+            retimestamp(
+                AutoFieldsModel.objects.all(),
+                'datetime_auto_now',
+                VALUE,
+                override=override_autonow(exclude_auto_now=True),
+            )
+
+    def test_excluded_auto_now_add(self):
+        with self.assertRaises(ValueError):
+            retimestamp(
+                AutoFieldsModel.objects.all(),
+                'datetime_auto_now_add',
+                VALUE,
+                override=override_autonow(exclude_auto_now_add=True),
+            )
+
+    def test_active_context(self):
+        with override_autonow(exclude_auto_now=True):
+            with self.assertRaises(ValueError):
+                retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', VALUE)
+            retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now_add', VALUE + datetime.timedelta(days=1))
+
+        self.assertEqual(AutoFieldsModel.objects.filter(datetime_auto_now_add=VALUE + datetime.timedelta(days=1)).count(), 5)
+
+    def test_sliced_queryset(self):
+        count = retimestamp(AutoFieldsModel.objects.order_by('pk')[:3], 'datetime_auto_now', datetime.timedelta(days=1), batch_size=2)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(AutoFieldsModel.objects.filter(datetime_auto_now=VALUE).count(), 2)
+
+    @override_settings(DATABASE_ROUTERS=['tests.test_retimestamp.RecordingRouter'])
+    def test_router(self):
+        RecordingRouter.calls.clear()
+        retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', VALUE)
+
+        self.assertIn('write', RecordingRouter.calls)
+        self.assertNotIn('read', RecordingRouter.calls)
+
+    def test_chunks_commit_separately(self):
+        update = QuerySet.update
+        with mock.patch.object(QuerySet, 'update', autospec=True) as mock_update:
+            mock_update.side_effect = _fail_after_first(update)
+            with self.assertRaises(RuntimeError):
+                retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', datetime.timedelta(days=1), batch_size=2)
+
+        self.assertEqual(AutoFieldsModel.objects.exclude(datetime_auto_now=VALUE).count(), 2)
+
+    def test_atomic(self):
+        update = QuerySet.update
+        with mock.patch.object(QuerySet, 'update', autospec=True) as mock_update:
+            mock_update.side_effect = _fail_after_first(update)
+            with self.assertRaises(RuntimeError):
+                retimestamp(AutoFieldsModel.objects.all(), 'datetime_auto_now', datetime.timedelta(days=1), batch_size=2, atomic=True)
+
+        self.assertEqual(AutoFieldsModel.objects.exclude(datetime_auto_now=VALUE).count(), 0)
+
+    def test_excluded_model(self):
+        with self.assertRaises(ValueError):
+            retimestamp(
+                AutoFieldsModel.objects.all(),
+                'datetime_auto_now',
+                VALUE,
+                override=override_autonow(override_models=(AutoFieldsModel2,)),
+            )
+
+
+def _fail_after_first(update):
+    calls = []
+
+    def side_effect(*args, **kwargs):
+        calls.append(args)
+        if len(calls) > 1:
+            raise RuntimeError
+        return update(*args, **kwargs)
+
+    return side_effect
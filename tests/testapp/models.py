@@ -13,3 +13,8 @@ class AutoFieldsModel2(models.Model):
     date_auto_now_add = models.DateField(auto_now_add=True, null=True)
     datetime_auto_now = models.DateTimeField(auto_now=True, null=True)
     datetime_auto_now_add = models.DateTimeField(auto_now_add=True, null=True)
+
+
+class DefaultFieldsModel(models.Model):
+    status = models.CharField(max_length=100, default='NEW')
+    datetime_auto_now_add = models.DateTimeField(auto_now_add=True, null=True)